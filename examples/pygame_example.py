@@ -32,7 +32,7 @@
 import sys
 
 import pygame as pg
-from typing import Optional, List, Sequence, cast
+from typing import Optional, List, Sequence
 
 from pybez import Number, Vec2, quadratic, cubic, Bezier, BezierMode, Point, PointMode, PointType
 
@@ -50,6 +50,17 @@ __all__ = [
 # ---------------------------------------------------------
 # region CONSTANTS & ENUMS
 
+# the only events the examples react to; everything else is kept off the
+# queue so it never wakes up the blocking event wait.
+HANDLED_EVENTS = [
+    pg.QUIT,
+    pg.KEYDOWN,
+    pg.MOUSEWHEEL,
+    pg.MOUSEMOTION,
+    pg.MOUSEBUTTONDOWN,
+    pg.MOUSEBUTTONUP,
+]
+
 # endregion (constants)
 # ---------------------------------------------------------
 # region CLASSES
@@ -59,23 +70,42 @@ __all__ = [
 # region FUNCTIONS
 
 
-def render_lines(surface, points, color, backcolor = (192, 192, 192)):
-    surface.fill(backcolor)
-    pg.draw.aalines(surface, color, False, points)
+def render_lines(surface, points, color, backcolor = (192, 192, 192), area = None) -> pg.Rect:
+    # the points are given to aalines() as baked: it antialiases using their
+    # fractional part, so rounding them first would only add work and jaggies
+    surface.fill(backcolor, area)
+    return pg.draw.aalines(surface, color, False, points)
+
+
+def join_lines(lines: Sequence[Sequence[Vec2]]) -> List[List[Vec2]]:
+    # joins each pair of consecutive lines starting at the same point into a
+    # single polyline passing through it, so both are drawn by one call
+    polylines: List[List[Vec2]] = []
+    for a, b in lines:
+        if polylines and len(polylines[-1]) == 2 and polylines[-1][1] == a:
+            polylines[-1].append(b)
+        else:
+            polylines.append([b, a])
+    return polylines
+
+
+def changed_area(rects: Sequence[pg.Rect]) -> pg.Rect:
+    # the area covered by the drawings of a frame, with room for the antialiasing
+    return rects[0].unionall(rects[1:]).inflate(2, 2)
 
 
 def hover_point(pt: Sequence[Number], margin: int = 3) -> Optional[Sequence[Number]]:
     x, y = pg.mouse.get_pos()
     px, py = pt
-    ox = x - px
-    oy = y - py
-    if abs(ox) > margin or abs(oy) > margin:
-        return None
-    return ox, oy
+    if x - margin <= px <= x + margin and y - margin <= py <= y + margin:
+        return x - px, y - py
+    return None
 
 
 def free() -> int:
     pg.init()
+    pg.event.set_blocked(None)
+    pg.event.set_allowed(HANDLED_EVENTS)
 
     surface: pg.Surface = pg.display.set_mode((640, 480))
 
@@ -93,15 +123,15 @@ def free() -> int:
     cubic_points = [[20 + i * (600 // cubic_num_points), 240] for i in range(cubic_num_points)]
 
     quadratic_num_points: int = 9
-    quadratic_points: Sequence[Sequence[Number]] = [[20 + i * (600 // quadratic_num_points), 240] for i in range(quadratic_num_points)]
+    quadratic_points: List[List[Number]] = [[20 + i * (600 // quadratic_num_points), 240] for i in range(quadratic_num_points)]
 
     num_points: int = cubic_num_points
-    points: Sequence[Sequence[Number]] = cubic_points
+    points: List[List[Number]] = cubic_points
     resolution: int = 7
 
     curve: Sequence[Sequence[Number]] = quadratic(points, resolution)
 
-    render_lines(surface, curve, linecolor, backcolor)
+    drawn: pg.Rect = changed_area([render_lines(surface, curve, linecolor, backcolor)])
 
     pg.display.flip()
 
@@ -112,82 +142,90 @@ def free() -> int:
     update_curve: bool = False
 
     while not done:
-        ev: pg.event.Event = pg.event.wait()
-        if ev.type == pg.QUIT:
-            done = True
-        elif ev.type == pg.KEYDOWN:
-            if ev.key == pg.K_ESCAPE:
+        events: List[pg.event.Event] = [pg.event.wait()]
+        events.extend(pg.event.get())
+        last: int = len(events) - 1
+        for k, ev in enumerate(events):
+            # of consecutive mouse motions only the last one matters
+            if ev.type == pg.MOUSEMOTION and k < last and events[k + 1].type == pg.MOUSEMOTION:
+                continue
+            if ev.type == pg.QUIT:
                 done = True
-            elif ev.key == pg.K_q:
-                if is_cubic:
-                    num_points = quadratic_num_points
-                    points = quadratic_points
-                    is_cubic = False
-                    update_curve = True
-                    update = True
-            elif ev.key == pg.K_c:
-                if not is_cubic:
-                    num_points = cubic_num_points
-                    points = cubic_points
-                    is_cubic = True
-                    update_curve = True
-                    update = True
-
-        elif ev.type == pg.MOUSEWHEEL:
-            resolution = max(3, resolution + ev.y)
-            update_curve = True
+            elif ev.type == pg.KEYDOWN:
+                if ev.key == pg.K_ESCAPE:
+                    done = True
+                elif ev.key == pg.K_q:
+                    if is_cubic:
+                        num_points = quadratic_num_points
+                        points = quadratic_points
+                        is_cubic = False
+                        update_curve = True
+                        update = True
+                elif ev.key == pg.K_c:
+                    if not is_cubic:
+                        num_points = cubic_num_points
+                        points = cubic_points
+                        is_cubic = True
+                        update_curve = True
+                        update = True
 
-        elif ev.type == pg.MOUSEMOTION:
-            if not dragging:
-                pt_index = -1
-                for i in range(num_points):
-                    offset = hover_point(points[i])
-                    if offset is not None:
-                        pt_index = i
+            elif ev.type == pg.MOUSEWHEEL:
+                resolution = max(3, resolution + ev.y)
+                update_curve = True
+
+            elif ev.type == pg.MOUSEMOTION:
+                if not dragging:
+                    pt_index = -1
+                    for i in range(num_points):
+                        offset = hover_point(points[i])
+                        if offset is not None:
+                            pt_index = i
+                            update = True
+                            break
+                else:
+                    if pt_index >= 0 and offset is not None:
+                        ox, oy = offset
+                        mx, my = ev.pos
+                        points[pt_index] = [mx + ox, my + oy]
                         update = True
-                        break
-            else:
+                        update_curve = True
+
+            elif ev.type == pg.MOUSEBUTTONDOWN:
                 if pt_index >= 0 and offset is not None:
-                    ox, oy = offset
-                    mx, my = ev.pos
-                    cast(List, points)[pt_index] = [mx + ox, my + oy]
+                    dragging = True
                     update = True
-                    update_curve = True
 
-        elif ev.type == pg.MOUSEBUTTONDOWN:
-            if pt_index >= 0 and offset is not None:
-                dragging = True
+            elif ev.type == pg.MOUSEBUTTONUP:
+                dragging = False
+                offset = None
+                pt_index = -1
                 update = True
 
-        elif ev.type == pg.MOUSEBUTTONUP:
-            dragging = False
-            offset = None
-            pt_index = -1
-            update = True
-
         if update_curve:
             if is_cubic:
                 curve = cubic(points, resolution)
             else:
                 curve = quadratic(points, resolution)
 
+        # only the area drawn on the previous frame is cleared, and only it and
+        # the area drawn now are sent to the display
         if update or update_curve:
-            render_lines(surface, curve, linecolor, backcolor)
+            rects: List[pg.Rect] = [render_lines(surface, curve, linecolor, backcolor, drawn)]
 
         if update:
+            # the control lines join every pair of consecutive points
+            rects.append(pg.draw.aalines(surface, ctrlline, False, points))
             for idx in range(num_points):
-                if idx % 2 == 1:
-                    pg.draw.aaline(surface, ctrlline, cast(tuple, points[idx - 1]), cast(tuple, points[idx]))
-                    pg.draw.aaline(surface, ctrlline, cast(tuple, points[idx]), cast(tuple, points[idx + 1]))
-
                 if pt_index == idx and dragging:
                     px, py = points[pt_index]
-                    pg.draw.rect(surface, dragpoint, (px - 3, py - 3, 7, 7))
+                    rects.append(surface.fill(dragpoint, (px - 3, py - 3, 7, 7)))
                 else:
-                    pg.draw.circle(surface, ctrlpoint, cast(tuple, points[idx]), 3, 1)
+                    rects.append(pg.draw.circle(surface, ctrlpoint, points[idx], 3, 1))
 
         if update or update_curve:
-            pg.display.flip()
+            area: pg.Rect = changed_area(rects)
+            pg.display.update(drawn.union(area))
+            drawn = area
             update = False
             update_curve = False
 
@@ -197,6 +235,8 @@ def free() -> int:
 
 def abstracted() -> int:
     pg.init()
+    pg.event.set_blocked(None)
+    pg.event.set_allowed(HANDLED_EVENTS)
 
     surface: pg.Surface = pg.display.set_mode((640, 480))
 
@@ -217,7 +257,7 @@ def abstracted() -> int:
 
     curve: Sequence[Vec2] = bezier.bake_curve(resolution)
 
-    render_lines(surface, curve, linecolor, backcolor)
+    drawn: pg.Rect = changed_area([render_lines(surface, curve, linecolor, backcolor)])
 
     pg.display.flip()
 
@@ -230,82 +270,92 @@ def abstracted() -> int:
     update_curve: bool = False
 
     while not done:
-        ev: pg.event.Event = pg.event.wait()
-        if ev.type == pg.QUIT:
-            done = True
-        elif ev.type == pg.KEYDOWN:
-            if ev.key == pg.K_ESCAPE:
+        events: List[pg.event.Event] = [pg.event.wait()]
+        events.extend(pg.event.get())
+        last: int = len(events) - 1
+        for k, ev in enumerate(events):
+            # of consecutive mouse motions only the last one matters
+            if ev.type == pg.MOUSEMOTION and k < last and events[k + 1].type == pg.MOUSEMOTION:
+                continue
+            if ev.type == pg.QUIT:
                 done = True
-            elif ev.key == pg.K_q:
-                if bezier.mode is BezierMode.CUBIC:
-                    bezier.mode = BezierMode.QUADRATIC
-                    update_curve = True
-                    update = True
-            elif ev.key == pg.K_c:
-                if bezier.mode is BezierMode.QUADRATIC:
-                    bezier.mode = BezierMode.CUBIC
-                    update_curve = True
-                    update = True
-            elif ev.key == pg.K_1:
-                if pt_last >= 0:
-                    bezier[pt_last].mode = PointMode.CUSP
-            elif ev.key == pg.K_2:
-                if pt_last >= 0:
-                    bezier[pt_last].mode = PointMode.SMOOTH
-            elif ev.key == pg.K_3:
-                if pt_last >= 0:
-                    bezier[pt_last].mode = PointMode.SYMMETRICAL
-
-        elif ev.type == pg.MOUSEWHEEL:
-            resolution = max(3, resolution + ev.y)
-            update_curve = True
-
-        elif ev.type == pg.MOUSEMOTION:
-            if not dragging:
-                pt_index = -1
-                offset = None
-                res = bezier.find_point(ev.pos, 3)
-                if res:
-                    pt_index, pt_type, offset = res
-            else:
+            elif ev.type == pg.KEYDOWN:
+                if ev.key == pg.K_ESCAPE:
+                    done = True
+                elif ev.key == pg.K_q:
+                    if bezier.mode is BezierMode.CUBIC:
+                        bezier.mode = BezierMode.QUADRATIC
+                        update_curve = True
+                        update = True
+                elif ev.key == pg.K_c:
+                    if bezier.mode is BezierMode.QUADRATIC:
+                        bezier.mode = BezierMode.CUBIC
+                        update_curve = True
+                        update = True
+                elif ev.key == pg.K_1:
+                    if pt_last >= 0:
+                        bezier[pt_last].mode = PointMode.CUSP
+                elif ev.key == pg.K_2:
+                    if pt_last >= 0:
+                        bezier[pt_last].mode = PointMode.SMOOTH
+                elif ev.key == pg.K_3:
+                    if pt_last >= 0:
+                        bezier[pt_last].mode = PointMode.SYMMETRICAL
+
+            elif ev.type == pg.MOUSEWHEEL:
+                resolution = max(3, resolution + ev.y)
+                update_curve = True
+
+            elif ev.type == pg.MOUSEMOTION:
+                if not dragging:
+                    pt_index = -1
+                    offset = None
+                    res = bezier.find_point(ev.pos, 3)
+                    if res:
+                        pt_index, pt_type, offset = res
+                else:
+                    if pt_index >= 0 and offset is not None:
+                        ox, oy = offset
+                        mx, my = ev.pos
+                        pt = [mx + ox, my + oy]
+                        bezier.move_point(pt_index, pt_type, pt, offset)
+                        update = True
+                        update_curve = True
+
+            elif ev.type == pg.MOUSEBUTTONDOWN:
                 if pt_index >= 0 and offset is not None:
-                    ox, oy = offset
-                    mx, my = ev.pos
-                    pt = [mx + ox, my + oy]
-                    bezier[pt_index].move_point(pt_type, pt, offset)
+                    dragging = True
                     update = True
-                    update_curve = True
+                    pt_last = pt_index
 
-        elif ev.type == pg.MOUSEBUTTONDOWN:
-            if pt_index >= 0 and offset is not None:
-                dragging = True
+            elif ev.type == pg.MOUSEBUTTONUP:
+                dragging = False
+                offset = None
+                pt_index = -1
                 update = True
-                pt_last = pt_index
-
-        elif ev.type == pg.MOUSEBUTTONUP:
-            dragging = False
-            offset = None
-            pt_index = -1
-            update = True
 
         if update_curve:
             curve = bezier.bake_curve(resolution)
 
+        # only the area drawn on the previous frame is cleared, and only it and
+        # the area drawn now are sent to the display
         if update or update_curve:
-            render_lines(surface, curve, linecolor, backcolor)
+            rects: List[pg.Rect] = [render_lines(surface, curve, linecolor, backcolor, drawn)]
 
         if update:
             for (px, py) in bezier.bake_control_points():
-                pg.draw.rect(surface, dragpoint, (px - 3, py - 3, 7, 7))
+                rects.append(surface.fill(dragpoint, (px - 3, py - 3, 7, 7)))
             for i, (px, py) in enumerate(bezier.bake_pos_points()):
                 if i == pt_last:
-                    pg.draw.rect(surface, lastpoint, (px - 4, py - 4, 9, 9), 1)
-                pg.draw.rect(surface, ctrlpoint, (px - 3, py - 3, 7, 7))
-            for (a, b) in bezier.bake_control_lines():
-                pg.draw.aaline(surface, ctrlline, a, b)
+                    rects.append(pg.draw.rect(surface, lastpoint, (px - 4, py - 4, 9, 9), 1))
+                rects.append(surface.fill(ctrlpoint, (px - 3, py - 3, 7, 7)))
+            for polyline in join_lines(bezier.bake_control_lines()):
+                rects.append(pg.draw.aalines(surface, ctrlline, False, polyline))
 
         if update or update_curve:
-            pg.display.flip()
+            area: pg.Rect = changed_area(rects)
+            pg.display.update(drawn.union(area))
+            drawn = area
             update = False
             update_curve = False
 
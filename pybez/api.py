@@ -28,11 +28,11 @@
 # ------------------------------------------------------------------------------
 
 # region IMPORTS
-import math
 import sys
 from enum import Enum, auto
+from functools import lru_cache, partial
 
-from typing import Optional, Any, Union, List, Tuple, Sequence
+from typing import Optional, Any, Union, List, Tuple, Sequence, Set, Callable
 
 # endregion (imports)
 # ---------------------------------------------------------
@@ -115,89 +115,224 @@ PT_POSITION = PointType.POSITION
 PT_CTRL_BEGIN = PointType.CTRL_BEGIN
 PT_CTRL_END = PointType.CTRL_END
 
+# highest resolution for which the curve kernels are generated fully unrolled
+_UNROLL_LIMIT = 32
+
 
 # endregion (constants)
 # ---------------------------------------------------------
 # region CLASSES
 
 
+class _PointArrays:
+    """Holds the vectors and modes of a sequence of points, one list per field.
+
+    The vectors are kept as complex numbers, `x + yj`. An end control is left
+    as None while it is the mirror of the begin control around the position;
+    the bakes of a quadratic bezier never need it."""
+
+    def __init__(self):
+        self._pos: List[complex] = []
+        self._begin: List[complex] = []
+        self._end: List[Optional[complex]] = []
+        self._modes: List[PointMode] = []
+
+    def _end_of(self, i: int) -> complex:
+        end = self._end[i]
+        if end is None:
+            pos = self._pos[i]
+            return pos + pos - self._begin[i]
+        return end
+
+    def _append_point(self, pos: complex, begin: complex, end: Optional[complex], mode: PointMode) -> int:
+        self._pos.append(pos)
+        self._begin.append(begin)
+        self._end.append(end)
+        self._modes.append(mode)
+        return len(self._pos) - 1
+
+
 class Point:
+    """Point class
+
+    A bezier point, made of a positional vector and the begin and end control
+    vectors around it. The vectors are kept as complex numbers, `x + yj`, and
+    converted to `(x, y)` tuples only when read; the end control is not stored
+    while it mirrors the begin control. Once given to a `Bezier`, a point no
+    longer holds its vectors itself: it becomes a view on the arrays of the
+    bezier.
 
-    __slots__ = 'pos', 'begin', 'end', 'mode'
+    :param x: x coordinate of the point
+    :param y: y coordinate of the point
+    :param dist: axis aligned distance between the point and its control points (default is 10)"""
+
+    __slots__ = '_pos', '_begin', '_end', '_mode', '_owner', '_index'
 
     def __init__(self, x: Number = 0, y: Number = 0, dist: Number = 10):
-        self.pos: Vec2 = [x, y]
-        self.begin: Vec2 = [x + dist, y]
-        self.end: Vec2 = [x - dist, y]
-        self.mode: PointMode = PM_SYMMETRICAL
+        self._pos: Optional[complex] = complex(x, y)
+        self._begin: Optional[complex] = self._pos + dist
+        self._end: Optional[complex] = None
+        self._mode: Optional[PointMode] = PM_SYMMETRICAL
+        # the `Bezier` holding this point, if any; `_index` is set with it
+        self._owner: Optional['Bezier'] = None
 
     def __getitem__(self, key):
         return self.pos.__getitem__(key)
 
     def __setitem__(self, key, value):
-        return self.pos.__getitem__(key, value)
+        pos = list(self.pos)
+        pos[key] = value
+        self.pos = pos
+
+    def _load(self) -> Tuple[complex, complex, Optional[complex], PointMode]:
+        owner = self._owner
+        if owner is None:
+            return self._pos, self._begin, self._end, self._mode
+        i = self._index
+        return owner._pos[i], owner._begin[i], owner._end[i], owner._modes[i]
+
+    def _vectors(self) -> Tuple[complex, complex, complex]:
+        pos, begin, end, _ = self._load()
+        if end is None:
+            end = pos + pos - begin
+        return pos, begin, end
+
+    def _store(self, pos: complex, begin: complex, end: Optional[complex]):
+        owner = self._owner
+        if owner is None:
+            self._pos, self._begin, self._end = pos, begin, end
+        else:
+            i = self._index
+            owner._pos[i], owner._begin[i], owner._end[i] = pos, begin, end
+            owner.invalidate(i)
+
+    @property
+    def pos(self) -> Vec2:
+        """Gets or sets the positional vector of this point."""
+        p = self._load()[0]
+        return p.real, p.imag
+
+    @pos.setter
+    def pos(self, value: Vec2):
+        _, begin, end = self._vectors()
+        self._store(complex(*value), begin, end)
+
+    @property
+    def begin(self) -> Vec2:
+        """Gets or sets the begin control vector of this point."""
+        p = self._load()[1]
+        return p.real, p.imag
+
+    @begin.setter
+    def begin(self, value: Vec2):
+        pos, _, end = self._vectors()
+        self._store(pos, complex(*value), end)
+
+    @property
+    def end(self) -> Vec2:
+        """Gets or sets the end control vector of this point."""
+        p = self._vectors()[2]
+        return p.real, p.imag
+
+    @end.setter
+    def end(self, value: Vec2):
+        pos, begin, _, _ = self._load()
+        self._store(pos, begin, complex(*value))
+
+    @property
+    def mode(self) -> PointMode:
+        """Gets or sets how the control vectors of this point behave when moved."""
+        return self._load()[3]
+
+    @mode.setter
+    def mode(self, value: PointMode):
+        if self._owner is None:
+            self._mode = value
+        else:
+            self._owner._modes[self._index] = value
 
     def find_point(self, location: Vec2, margin: int = 2) -> Optional[Tuple[PointType, Vec2]]:
-        for i, p in enumerate((self.pos, self.begin, self.end)):
-            x, y = location
-            px, py = p
-            ox = x - px
-            oy = y - py
-
-            if abs(ox) > margin or abs(oy) > margin:
-                continue
-            return (PT_POSITION, PT_CTRL_BEGIN, PT_CTRL_END)[i], [ox, oy]
+        x, y = location
+        left, right = x - margin, x + margin
+        top, bottom = y - margin, y + margin
+        for n, p in enumerate(self._vectors()):
+            px = p.real
+            py = p.imag
+            if left <= px <= right and top <= py <= bottom:
+                return (PT_POSITION, PT_CTRL_BEGIN, PT_CTRL_END)[n], [x - px, y - py]
         return None
 
     def move_point(self, point_type: PointType, position: Vec2, offset: Vec2 = (0, 0)):
         x, y = position
         ox, oy = offset
-        px, py = self.pos
-        bx, by = self.begin
-        ex, ey = self.end
-        dbx, dby = bx - px, by - py
-        dex, dey = ex - px, ey - py
+        to: complex = complex(ox + x, oy + y)
+        pos, begin, end, mode = self._load()
         if point_type is PT_POSITION:
-            self.pos = ox + x, oy + y
-            self.begin = ox + x + dbx, oy + y + dby
-            self.end = ox + x + dex, oy + y + dey
+            delta: complex = to - pos
+            pos = to
+            begin += delta
+            if end is not None:
+                end += delta
+        # a cusp leaves the opposite control alone, a symmetrical point mirrors
+        # it and only a smooth one needs the length of the opposite control;
+        # an unset end mirrors begin, so it is set from begin before it moves
         elif point_type is PT_CTRL_BEGIN:
-            elen: Number = length((dex, dey))
-            dbx, dby = (ox + x) - px, (oy + y) - py
-            self.begin = ox + x, oy + y
-            if self.mode == PM_SMOOTH:
-                ex, ey = normal(opposite((dbx, dby)), elen)
-                self.end = px + ex, py + ey
-            elif self.mode == PM_SYMMETRICAL:
-                ex, ey = opposite((dbx, dby))
-                self.end = px + ex, py + ey
+            if end is None and mode is not PM_SYMMETRICAL:
+                end = pos + pos - begin
+            begin = to
+            if mode is PM_SYMMETRICAL:
+                end = None
+            elif mode is PM_SMOOTH:
+                end = pos + normal(opposite(to - pos), length(end - pos))
         elif point_type is PT_CTRL_END:
-            self.end = ox + x, oy + y
-            blen: Number = length((dbx, dby))
-            dex, dey = (ox + x) - px, (oy + y) - py
-            self.end = ox + x, oy + y
-            if self.mode == PM_SMOOTH:
-                bx, by = normal(opposite((dex, dey)), blen)
-                self.begin = px + bx, py + by
-            elif self.mode == PM_SYMMETRICAL:
-                bx, by = opposite((dex, dey))
-                self.begin = px + bx, py + by
-
-
-class Bezier:
+            end = to
+            if mode is PM_SYMMETRICAL:
+                begin = pos + opposite(to - pos)
+            elif mode is PM_SMOOTH:
+                begin = pos + normal(opposite(to - pos), length(begin - pos))
+        self._store(pos, begin, end)
+
+
+class Bezier(_PointArrays):
     """Bezier class
 
     Abstracts a modifiable bezier curve that can be used to generate a sequence
     of baked points for use in other places.
 
-    It can be used in quadratic or cubic modes
+    It can be used in quadratic or cubic modes. The vectors of its points are
+    stored in per-field arrays; the given `Point`s are moved into them and keep
+    working as views on this bezier. A `Point` can belong to only one bezier,
+    changing it discards the baked data of the bezier around it.
 
     :param mode: the `BezierMode`, cubic or quadratic
     :param points: the starting sequence o `Point`s to this bezier"""
 
     def __init__(self, mode: BezierMode, *points: Point):
+        super().__init__()
         self._points: List[Point] = list(points)
         self._is_cubic: bool = mode is BM_CUBIC
+        # the vectors move into the arrays and the points become views on them,
+        # keeping no vectors of their own
+        self._pos = [point._pos for point in points]
+        if None in self._pos or len(set(points)) != len(points):
+            raise ValueError("Point already belongs to a Bezier.")
+        self._begin = [point._begin for point in points]
+        self._end = [point._end for point in points]
+        self._modes = [point._mode for point in points]
+        for i, point in enumerate(points):
+            point._owner = self
+            point._index = i
+            point._pos = point._begin = point._end = point._mode = None
+
+        # baking caches; `_dirty` holds the indices of the curve segments
+        # that must be re-evaluated on the next `bake_curve()`.
+        self._dirty: Set[int] = set()
+        self._curve: Optional[List[Vec2]] = None
+        self._curve_key: Optional[Tuple[int, bool]] = None
+        self._ctrl_pts: Optional[List[Vec2]] = None
+        self._ctrl_lines: Optional[List[Tuple[Vec2, Vec2]]] = None
+        self._pos_pts: Optional[List[Vec2]] = None
+        self._hit_pts: Optional[List[Tuple[float, float, int, PointType]]] = None
 
     def __getitem__(self, key) -> Point:
         return self._points.__getitem__(key)
@@ -210,6 +345,7 @@ class Bezier:
     @mode.setter
     def mode(self, value: BezierMode):
         self._is_cubic = value is BM_CUBIC
+        self.invalidate()
 
     def add_point(self, x: Number, y: Number, dist: Number = 10):
         """Adds a bezier `Point`
@@ -218,7 +354,48 @@ class Bezier:
         :param y: y coordinate of the point
         :param dist: axis aligned distance between the point and its control points (default is 10)
         """
-        self._points.append(Point(x, y, dist))
+        self._add(Point(x, y, dist))
+        self.invalidate()
+
+    def _add(self, point: Point):
+        if point._owner is not None:
+            raise ValueError("Point already belongs to a Bezier.")
+        # the vectors move into the arrays, the point becomes a view on them
+        point._index = self._append_point(point._pos, point._begin, point._end, point._mode)
+        point._owner = self
+        point._pos = point._begin = point._end = point._mode = None
+        self._points.append(point)
+
+    def move_point(self, index: int, point_type: PointType, position: Vec2, offset: Vec2 = (0, 0)):
+        """Moves the vector `point_type` of the `Point` at `index`, same as `self[index].move_point()`
+
+        :param index: the index of the point
+        :param point_type: which vector of the point to move
+        :param position: the new position
+        :param offset: an offset added to `position`
+        """
+        self._points[index].move_point(point_type, position, offset)
+
+    def invalidate(self, index: Optional[int] = None):
+        """Discards the baked data of this bezier
+
+        :param index: the index of a modified point, only the curve segments touching it
+            are baked again; if None (the default) the whole curve is baked again
+        """
+        self._ctrl_pts = None
+        self._ctrl_lines = None
+        self._pos_pts = None
+        self._hit_pts = None
+        if index is None or self._curve is None:
+            self._curve = None
+            self._dirty.clear()
+            return
+        if index < 0:
+            index += len(self._pos)
+        # a point is shared by the segment ending and the one starting on it
+        for seg in (index - 1, index):
+            if 0 <= seg < len(self._pos) - 1:
+                self._dirty.add(seg)
 
     def find_point(self, location: Vec2, margin: int = 2) -> Optional[Tuple[int, PointType, Vec2]]:
         """Returns an index, a point type and an offset if this bezier has a point around `location` and `margin`.
@@ -226,94 +403,163 @@ class Bezier:
         :param location: the position to test if a bezier point exists
         :param margin: a margin to consider if a point is found
         :returns: a tuple of int, PointType and Vec2 if a point was found, or None otherwise"""
-        for i, p in enumerate(self._points):
-            res = p.find_point(location, margin)
-            if res is not None:
-                pty, ofs = res
-                if not self._is_cubic and pty is PT_CTRL_END:
-                    continue
-                return i, pty, ofs
+        if self._hit_pts is None:
+            self._rebake()
+        candidates = self._hit_pts
+
+        # test the candidates against the box around `location` rather than
+        # computing the offset of each one
+        x, y = location
+        left, right = x - margin, x + margin
+        top, bottom = y - margin, y + margin
+        for px, py, i, pty in candidates:
+            if left <= px <= right and top <= py <= bottom:
+                return i, pty, [x - px, y - py]
         return None
 
     def bake_control_points(self) -> Sequence[Vec2]:
         """Returns a sequence of all no positional points of this bezier"""
-        points = []
-        last = len(self._points) - 1
-        if self._is_cubic:
-            for i, point in enumerate(self._points):
-                if i == 0:
-                    points.append(point.begin)
-                elif i == last:
-                    points.append(point.end)
-                else:
-                    points.extend((point.end, point.begin))
-        else:
-            for i, point in enumerate(self._points):
-                if i != last:
-                    points.append(point.begin)
-
-        return points
+        if self._ctrl_pts is None:
+            self._rebake()
+        return list(self._ctrl_pts)
 
     def bake_control_lines(self) -> Sequence[Sequence[Vec2]]:
         """Returns a sequence of lines between control points and its positional points"""
-        points = []
-        last = len(self._points) - 1
-        if self._is_cubic:
-            for i, point in enumerate(self._points):
-                if i == 0:
-                    points.append((point.pos, point.begin))
-                elif i == last:
-                    points.append((point.pos, point.end))
-                else:
-                    points.append((point.pos, point.begin))
-                    points.append((point.pos, point.end))
-        else:
-            for i, point in enumerate(self._points):
-                if i != last:
-                    points.append((point.pos, point.begin))
-
-        return points
+        if self._ctrl_lines is None:
+            self._rebake()
+        return list(self._ctrl_lines)
 
     def bake_points(self) -> Sequence[Vec2]:
         """Returns a sequence of control points and positional points"""
-        points = []
-        last = len(self._points) - 1
+        pos, begin, end_of = self._pos, self._begin, self._end_of
+        last = len(pos) - 1
+        seq: List[complex] = []
         if self._is_cubic:
-            for i, point in enumerate(self._points):
+            for i in range(last + 1):
                 if i == 0:
-                    points.extend((point.pos, point.begin))
+                    seq.extend((pos[i], begin[i]))
                 elif i == last:
-                    points.extend((point.end, point.pos))
+                    seq.extend((end_of(i), pos[i]))
                 else:
-                    points.extend((point.end, point.pos, point.begin))
+                    seq.extend((end_of(i), pos[i], begin[i]))
         else:
-            for i, point in enumerate(self._points):
+            for i in range(last + 1):
                 if i == last:
-                    points.append(point.pos)
+                    seq.append(pos[i])
                 else:
-                    points.extend((point.pos, point.begin))
+                    seq.extend((pos[i], begin[i]))
 
-        return points
+        return [(c.real, c.imag) for c in seq]
 
     def bake_pos_points(self) -> Sequence[Vec2]:
         """Returns a sequence of positional points"""
-        points = []
-        for point in self._points:
-            points.append(point.pos)
-
-        return points
+        if self._pos_pts is None:
+            self._rebake()
+        return list(self._pos_pts)
+
+    def _rebake(self, resolution: Optional[int] = None):
+        # fills, in a single pass over the points, the control points, control
+        # lines, positional points and hit-test candidates if they are out of
+        # date, and the whole curve if a `resolution` is given.
+        pos, begin, end = self._pos, self._begin, self._end
+        is_cubic: bool = self._is_cubic
+        last: int = len(pos) - 1
+        handles: bool = self._ctrl_pts is None
+        ctrl_pts: List[Vec2] = []
+        ctrl_lines: List[Tuple[Vec2, Vec2]] = []
+        pos_pts: List[Vec2] = []
+        hit_pts: List[Tuple[float, float, int, PointType]] = []
+        curve: Optional[List[Vec2]] = None
+        if resolution is not None:
+            curve = [None] * (last * resolution + 1)
+            kernel: Callable[..., Sequence[Vec2]] = _cubic_kernel(resolution) if is_cubic else _quadratic_kernel(resolution)
+
+        # module level names and bound methods used on every point
+        pt_position, pt_ctrl_begin, pt_ctrl_end = PT_POSITION, PT_CTRL_BEGIN, PT_CTRL_END
+        add_pos_pt = pos_pts.append
+        add_hit_pt = hit_pts.append
+
+        for i in range(last + 1):
+            p, b = pos[i], begin[i]
+            px, py = p.real, p.imag
+            bx, by = b.real, b.imag
+            if handles:
+                pv, bv = (px, py), (bx, by)
+                add_pos_pt(pv)
+                add_hit_pt((px, py, i, pt_position))
+                add_hit_pt((bx, by, i, pt_ctrl_begin))
+                if is_cubic:
+                    e = end[i]
+                    if e is None:
+                        e = p + p - b
+                    ev = e.real, e.imag
+                    add_hit_pt((ev[0], ev[1], i, pt_ctrl_end))
+                    if i == 0:
+                        ctrl_pts.append(bv)
+                        ctrl_lines.append((pv, bv))
+                    elif i == last:
+                        ctrl_pts.append(ev)
+                        ctrl_lines.append((pv, ev))
+                    else:
+                        ctrl_pts.extend((ev, bv))
+                        ctrl_lines.extend(((pv, bv), (pv, ev)))
+                elif i != last:
+                    ctrl_pts.append(bv)
+                    ctrl_lines.append((pv, bv))
+            if curve is not None and i != last:
+                d = pos[i + 1]
+                if is_cubic:
+                    c = end[i + 1]
+                    if c is None:
+                        c = d + d - begin[i + 1]
+                    curve[i * resolution: (i + 1) * resolution] = kernel(px, py, bx, by, c.real, c.imag, d.real, d.imag)
+                else:
+                    curve[i * resolution: (i + 1) * resolution] = kernel(px, py, bx, by, d.real, d.imag)
+
+        if handles:
+            self._ctrl_pts = ctrl_pts
+            self._ctrl_lines = ctrl_lines
+            self._pos_pts = pos_pts
+            self._hit_pts = hit_pts
+        if curve is not None:
+            p = pos[last]
+            curve[-1] = p.real, p.imag
+            self._curve = curve
+            self._curve_key = resolution, is_cubic
+            self._dirty.clear()
+
+    def _bake_segment(self, seg: int, resolution: int) -> Sequence[Vec2]:
+        a: complex = self._pos[seg]
+        b: complex = self._begin[seg]
+        d: complex = self._pos[seg + 1]
+        if self._is_cubic:
+            c: complex = self._end_of(seg + 1)
+            return _cubic_kernel(resolution)(a.real, a.imag, b.real, b.imag, c.real, c.imag, d.real, d.imag)
+        return _quadratic_kernel(resolution)(a.real, a.imag, b.real, b.imag, d.real, d.imag)
 
     def bake_curve(self, resolution: int = 3) -> Sequence[Vec2]:
         """Generates and returns the curve points from given `resolution` (minimum of 3)
 
+        The baked curve is kept, so the following calls bake again only the segments
+        touching the points moved since. Each call returns a new list.
+
         :param resolution: number of points in each curve segment, higher values produces smoother curves
         :returns: the baked bezier curve
         """
-        points = self.bake_points()
-        if self._is_cubic:
-            return cubic(points, resolution)
-        else:
-            return quadratic(points, resolution)
+        if self._curve is None or self._curve_key != (resolution, self._is_cubic):
+            if len(self._pos) < 2:
+                raise ValueError("Number of points is too low.")
+            if resolution < 3:
+                raise ValueError("Resolution is too low.")
+            self._rebake(resolution)
+        elif self._dirty:
+            curve = self._curve
+            for seg in self._dirty:
+                curve[seg * resolution: (seg + 1) * resolution] = self._bake_segment(seg, resolution)
+            p = self._pos[-1]
+            curve[-1] = p.real, p.imag
+        self._dirty.clear()
+        return list(self._curve)
 
 # endregion (classes)
 # ---------------------------------------------------------
@@ -323,19 +569,19 @@ class Bezier:
 # region INTERNAL API
 
 
-def opposite(p: Vec2) -> Vec2:
-    return [-p[0], -p[1]]
+def opposite(p: complex) -> complex:
+    return -p
 
 
-def length(p: Vec2) -> Number:
-    return math.sqrt(p[0] ** 2 + p[1] ** 2)
+def length(p: complex) -> float:
+    return abs(p)
 
 
-def normal(p: Vec2, scale: Number = 1) -> Vec2:
-    point_length: int = length(p)
+def normal(p: complex, scale: Number = 1) -> complex:
+    point_length: float = abs(p)
     if point_length != 0:
-        return [(p[0] / point_length) * scale, (p[1] / point_length) * scale]
-    return [0, 0]
+        return p / point_length * scale
+    return 0j
 
 
 def cubic_segments(x: Union[int, Sequence[Any]]) -> int:
@@ -393,6 +639,110 @@ def lerp2(a: Vec2, b: Vec2, r: float) -> Sequence[float]:
     return a[0] + (b[0] - a[0]) * r, a[1] + (b[1] - a[1]) * r
 
 
+def _quadratic_segment(ax: float, ay: float, bx: float, by: float, cx: float, cy: float,
+                       resolution: int) -> List[Vec2]:
+    """Returns `resolution` points of the quadratic segment a, b, c, leaving out c.
+
+    The curve is sampled at uniform steps of t, so it is walked with forward
+    differences of its polynomial form q*t^2 + 2*(b - a)*t + a."""
+    incr: float = 1 / resolution
+    incr2: float = incr * incr
+    qx = ax - 2 * bx + cx
+    qy = ay - 2 * by + cy
+    x, y = float(ax), float(ay)
+    dx = qx * incr2 + 2 * (bx - ax) * incr
+    dy = qy * incr2 + 2 * (by - ay) * incr
+    ddx = 2 * qx * incr2
+    ddy = 2 * qy * incr2
+    out: List[Vec2] = []
+    append = out.append
+    for _ in range(resolution):
+        append((x, y))
+        x += dx
+        y += dy
+        dx += ddx
+        dy += ddy
+    return out
+
+
+def _cubic_segment(ax: float, ay: float, bx: float, by: float,
+                   cx: float, cy: float, dx: float, dy: float, resolution: int) -> List[Vec2]:
+    """Returns `resolution` points of the cubic segment a, b, c, d, leaving out d.
+
+    The curve is sampled at uniform steps of t, so it is walked with forward
+    differences of its polynomial form p*t^3 + q*t^2 + 3*(b - a)*t + a."""
+    incr: float = 1 / resolution
+    incr2: float = incr * incr
+    incr3: float = incr2 * incr
+    px = dx - ax + 3 * (bx - cx)
+    py = dy - ay + 3 * (by - cy)
+    qx = 3 * (ax - 2 * bx + cx)
+    qy = 3 * (ay - 2 * by + cy)
+    x, y = float(ax), float(ay)
+    fx = px * incr3 + qx * incr2 + 3 * (bx - ax) * incr
+    fy = py * incr3 + qy * incr2 + 3 * (by - ay) * incr
+    ffx = 6 * px * incr3 + 2 * qx * incr2
+    ffy = 6 * py * incr3 + 2 * qy * incr2
+    fffx = 6 * px * incr3
+    fffy = 6 * py * incr3
+    out: List[Vec2] = []
+    append = out.append
+    for _ in range(resolution):
+        append((x, y))
+        x += fx
+        y += fy
+        fx += ffx
+        fy += ffy
+        ffx += fffx
+        ffy += fffy
+    return out
+
+
+def _weighted_sum(weights: Sequence[float], names: Sequence[str]) -> str:
+    # unit weights are kept as `1.0 * name` too, so every point is made of floats
+    return ' + '.join(f'{w!r} * {name}' for w, name in zip(weights, names) if w != 0)
+
+
+def _compile_kernel(name: str, params: Sequence[str], weights: Sequence[Sequence[float]]) -> Callable[..., Sequence[Vec2]]:
+    # generates `name(*params)`, returning a tuple with one point per row of
+    # `weights`, with every weight written as a literal and no loop.
+    xs, ys = params[0::2], params[1::2]
+    rows = [f'({_weighted_sum(w, xs)}, {_weighted_sum(w, ys)})' for w in weights]
+    source = (f'def {name}({", ".join(params)}):\n'
+              f'    return (\n'
+              f'        {", ".join(rows)},\n'
+              f'    )\n')
+    namespace = {}
+    exec(compile(source, f'<pybez {name}>', 'exec'), namespace)
+    return namespace[name]
+
+
+@lru_cache(maxsize=None)
+def _quadratic_kernel(resolution: int) -> Callable[..., Sequence[Vec2]]:
+    """Returns a `_quadratic_segment()` specialized for `resolution`, without its last argument."""
+    if resolution > _UNROLL_LIMIT:
+        return partial(_quadratic_segment, resolution=resolution)
+    weights = []
+    for k in range(resolution):
+        t = k / resolution
+        u = 1 - t
+        weights.append((u * u, 2 * u * t, t * t))
+    return _compile_kernel(f'quadratic_{resolution}', ('ax', 'ay', 'bx', 'by', 'cx', 'cy'), weights)
+
+
+@lru_cache(maxsize=None)
+def _cubic_kernel(resolution: int) -> Callable[..., Sequence[Vec2]]:
+    """Returns a `_cubic_segment()` specialized for `resolution`, without its last argument."""
+    if resolution > _UNROLL_LIMIT:
+        return partial(_cubic_segment, resolution=resolution)
+    weights = []
+    for k in range(resolution):
+        t = k / resolution
+        u = 1 - t
+        weights.append((u * u * u, 3 * u * u * t, 3 * u * t * t, t * t * t))
+    return _compile_kernel(f'cubic_{resolution}', ('ax', 'ay', 'bx', 'by', 'cx', 'cy', 'dx', 'dy'), weights)
+
+
 # endregion (internal api)
 
 # region PUBLIC API
@@ -414,30 +764,24 @@ def quadratic(points: Sequence[Vec2], resolution: int) -> Sequence[Vec2]:
     """
 
     n = len(points)
-    try:
-        assert n % 2 == 1, "An odd number of points must be provided."
-        assert resolution >= 3, "Resolution is too low."
-        assert n >= 3, "Number of points is too low."
-    except AssertionError as e:
-        raise ValueError(*e.args)
-
-    result: List[Vec2] = []
+    if n % 2 != 1:
+        raise ValueError("An odd number of points must be provided.")
+    if resolution < 3:
+        raise ValueError("Resolution is too low.")
+    if n < 3:
+        raise ValueError("Number of points is too low.")
+
     steps: int = (n - 1) // 2
-    incr: float = 1 / resolution
+    result: List[Vec2] = [None] * (steps * resolution + 1)
+    kernel: Callable[..., Sequence[Vec2]] = _quadratic_kernel(resolution)
 
-    r: float
-    la: Vec2
-    lb: Vec2
-    lc: Vec2
     for step in range(steps):
-        r = 0.0
         i = step * 2
-        for n in range(resolution):
-            la = lerp2(points[i], points[i + 1], r)
-            lb = lerp2(points[i + 1], points[i + 2], r)
-            result.append(lerp2(la, lb, r))
-            r += incr
-    result.append(points[-1])
+        ax, ay = points[i]
+        bx, by = points[i + 1]
+        cx, cy = points[i + 2]
+        result[step * resolution: (step + 1) * resolution] = kernel(ax, ay, bx, by, cx, cy)
+    result[-1] = points[-1]
 
     return result
 
@@ -463,37 +807,23 @@ def cubic(points: Sequence[Vec2], resolution: int) -> Sequence[Vec2]:
     """
 
     n: int = len(points)
-    try:
-        assert n >= 4, "Number of points is too low."
-        assert (n - 4) % 3 == 0, "Too many or too few points provided."
-        assert resolution >= 3, "Resolution is too low."
-    except AssertionError as err:
-        raise ValueError(*err.args)
-
-    result: List[Vec2] = []
+    if n < 4:
+        raise ValueError("Number of points is too low.")
+    if (n - 4) % 3 != 0:
+        raise ValueError("Too many or too few points provided.")
+    if resolution < 3:
+        raise ValueError("Resolution is too low.")
+
     steps: int = cubic_segments(n)
-    incr: float = 1 / resolution
+    result: List[Vec2] = [None] * (steps * resolution + 1)
+    kernel: Callable[..., Sequence[Vec2]] = _cubic_kernel(resolution)
 
-    r: float
-    e: Vec2
-    f: Vec2
-    g: Vec2
-    h: Vec2
-    i: Vec2
     for step in range(steps):
-        r = 0.0
         s = step * 3
-        a, b, c, d = points[s: s + 4]
-        for n in range(resolution):
-            e = lerp2(a, b, r)
-            f = lerp2(b, c, r)
-            g = lerp2(c, d, r)
-            h = lerp2(e, f, r)
-            i = lerp2(f, g, r)
-            result.append(lerp2(h, i, r))
-            r += incr
-
-    result.append(points[-1])
+        (ax, ay), (bx, by), (cx, cy), (dx, dy) = points[s: s + 4]
+        result[step * resolution: (step + 1) * resolution] = kernel(ax, ay, bx, by, cx, cy, dx, dy)
+
+    result[-1] = points[-1]
 
     return result
 
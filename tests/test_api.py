@@ -0,0 +1,227 @@
+import random
+import unittest
+
+from pybez import (Bezier, Point, BM_CUBIC, BM_QUADRATIC, PM_CUSP, PM_SMOOTH, PM_SYMMETRICAL,
+                   PT_POSITION, PT_CTRL_BEGIN, PT_CTRL_END, cubic, quadratic)
+
+
+def plain(value):
+    """Returns `value` with every nested sequence turned into a tuple."""
+    if isinstance(value, (list, tuple)):
+        return tuple(plain(v) for v in value)
+    return value
+
+
+def casteljau(points, t):
+    """Returns the point at `t` of the bezier segment `points`, by de Casteljau's algorithm."""
+    while len(points) > 1:
+        points = [(a[0] + (b[0] - a[0]) * t, a[1] + (b[1] - a[1]) * t) for a, b in zip(points, points[1:])]
+    return points[0]
+
+
+def reference(points, resolution, degree):
+    curve = []
+    for s in range(0, len(points) - 1, degree):
+        curve.extend(casteljau(points[s: s + degree + 1], k / resolution) for k in range(resolution))
+    curve.append(points[-1])
+    return curve
+
+
+def bakes(bezier, resolution):
+    return plain((bezier.bake_curve(resolution), bezier.bake_control_points(),
+                  bezier.bake_control_lines(), bezier.bake_pos_points()))
+
+
+def full_bakes(bezier, resolution):
+    """Returns the curve and handles of `bezier` baked from scratch."""
+    bezier.invalidate()
+    return bakes(bezier, resolution)
+
+
+class TestBezierCache(unittest.TestCase):
+
+    def make_bezier(self, mode):
+        return Bezier(mode, *(Point(20 + i * 100, 240) for i in range(6)))
+
+    def test_point_move_invalidates(self):
+        bz = self.make_bezier(BM_CUBIC)
+        bz.bake_curve(7)
+        bz.bake_pos_points()
+        bz[1].move_point(PT_POSITION, (200, 100))
+        self.assertEqual(plain(bz.bake_pos_points()[1]), (200, 100))
+        self.assertEqual(bz.find_point((200, 100), 3)[:2], (1, PT_POSITION))
+        self.assertEqual(bakes(bz, 7), full_bakes(bz, 7))
+
+    def test_point_setters_invalidate(self):
+        bz = self.make_bezier(BM_QUADRATIC)
+        bz.bake_curve(5)
+        bz[2].pos = (0, 0)
+        self.assertEqual(bakes(bz, 5), full_bakes(bz, 5))
+        bz[3].begin = (10, 20)
+        self.assertEqual(bakes(bz, 5), full_bakes(bz, 5))
+        bz[4][1] = 300
+        self.assertEqual(bakes(bz, 5), full_bakes(bz, 5))
+        bz.mode = BM_CUBIC
+        bz.bake_curve(5)
+        bz[1].end = (50, 60)
+        self.assertEqual(bakes(bz, 5), full_bakes(bz, 5))
+
+    def test_points_belong_to_one_bezier(self):
+        p, q = Point(0, 0), Point(100, 0)
+        bz = Bezier(BM_QUADRATIC, p, Point(50, 50), q)
+        self.assertIs(bz[0], p)
+        bz.bake_curve(5)
+        p.move_point(PT_POSITION, (50, 50))
+        self.assertEqual(plain(bz[0].pos), (50, 50))
+        self.assertEqual(bakes(bz, 5), full_bakes(bz, 5))
+        self.assertRaises(ValueError, Bezier, BM_QUADRATIC, p, Point(), Point())
+        r = Point()
+        self.assertRaises(ValueError, Bezier, BM_QUADRATIC, r, r, Point())
+
+    def test_bakes_are_not_shared(self):
+        bz = self.make_bezier(BM_CUBIC)
+        curve = bz.bake_curve(7)
+        saved = list(curve)
+        bz.move_point(1, PT_POSITION, (200, 100))
+        self.assertEqual(curve, saved)
+        self.assertIsNot(bz.bake_curve(7), bz.bake_curve(7))
+        pos_pts = bz.bake_pos_points()
+        pos_pts[0] = None
+        self.assertEqual(plain(bz.bake_pos_points()[0]), (20, 240))
+
+    def test_incremental_matches_full_bake(self):
+        rnd = random.Random(1)
+        for mode in (BM_QUADRATIC, BM_CUBIC):
+            bz = self.make_bezier(mode)
+            for _ in range(300):
+                i = rnd.randrange(6)
+                bz[i].mode = rnd.choice((PM_CUSP, PM_SMOOTH, PM_SYMMETRICAL))
+                point_type = rnd.choice((PT_POSITION, PT_CTRL_BEGIN, PT_CTRL_END))
+                to = rnd.uniform(0, 640), rnd.uniform(0, 480)
+                if rnd.random() < 0.5:
+                    bz.move_point(i, point_type, to)
+                else:
+                    bz[i].move_point(point_type, to)
+                resolution = rnd.choice((3, 7, 40))
+                self.assertEqual(bakes(bz, resolution), full_bakes(bz, resolution))
+
+
+class TestPointModes(unittest.TestCase):
+
+    def points(self):
+        """Yields a standalone point and a point of a bezier, both at (0, 0) with a distance of 10."""
+        yield Point(0, 0, 10)
+        yield Bezier(BM_CUBIC, Point(-50, 0), Point(0, 0, 10), Point(50, 0))[1]
+
+    def assertVecEqual(self, vec, expected):
+        self.assertAlmostEqual(vec[0], expected[0])
+        self.assertAlmostEqual(vec[1], expected[1])
+
+    def test_cusp(self):
+        for p in self.points():
+            p.mode = PM_CUSP
+            p.move_point(PT_CTRL_BEGIN, (0, 20))
+            self.assertVecEqual(p.begin, (0, 20))
+            self.assertVecEqual(p.end, (-10, 0))
+            p.move_point(PT_CTRL_END, (5, -5))
+            self.assertVecEqual(p.begin, (0, 20))
+            self.assertVecEqual(p.end, (5, -5))
+
+    def test_smooth(self):
+        for p in self.points():
+            p.end = (-5, 0)
+            p.mode = PM_SMOOTH
+            p.move_point(PT_CTRL_BEGIN, (0, 20))
+            self.assertVecEqual(p.begin, (0, 20))
+            self.assertVecEqual(p.end, (0, -5))
+            p.move_point(PT_CTRL_END, (30, 40))
+            self.assertVecEqual(p.begin, (-12, -16))
+            self.assertVecEqual(p.end, (30, 40))
+
+    def test_symmetrical(self):
+        for p in self.points():
+            p.end = (-5, 0)
+            p.mode = PM_SYMMETRICAL
+            p.move_point(PT_CTRL_BEGIN, (3, 4))
+            self.assertVecEqual(p.begin, (3, 4))
+            self.assertVecEqual(p.end, (-3, -4))
+            p.move_point(PT_CTRL_END, (0, 20))
+            self.assertVecEqual(p.begin, (0, -20))
+            self.assertVecEqual(p.end, (0, 20))
+
+    def test_position_moves_controls(self):
+        for p in self.points():
+            p.move_point(PT_POSITION, (5, 5))
+            self.assertVecEqual(p.pos, (5, 5))
+            self.assertVecEqual(p.begin, (15, 5))
+            self.assertVecEqual(p.end, (-5, 5))
+
+
+    def test_unset_end_is_stored_before_it_changes(self):
+        # a fresh point mirrors its end from begin until the end is needed
+        for p in self.points():
+            p.mode = PM_CUSP
+            p.move_point(PT_CTRL_BEGIN, (0, 20))
+            self.assertVecEqual(p.end, (-10, 0))
+        for p in self.points():
+            p.mode = PM_SMOOTH
+            p.move_point(PT_CTRL_BEGIN, (0, 30))
+            self.assertVecEqual(p.end, (0, -10))
+        for p in self.points():
+            p.begin = (0, 20)
+            self.assertVecEqual(p.end, (-10, 0))
+        for p in self.points():
+            p.pos = (5, 0)
+            self.assertVecEqual(p.begin, (10, 0))
+            self.assertVecEqual(p.end, (-10, 0))
+
+    def test_symmetrical_end_stays_unset(self):
+        p = Point(0, 0, 10)
+        p.move_point(PT_CTRL_BEGIN, (3, 4))
+        self.assertIsNone(p._end)
+        bz = Bezier(BM_CUBIC, Point(-50, 0), Point(0, 0, 10), Point(50, 0))
+        bz[1].move_point(PT_CTRL_BEGIN, (3, 4))
+        self.assertIsNone(bz._end[1])
+        self.assertVecEqual(bz[1].end, (-3, -4))
+
+
+class TestCurves(unittest.TestCase):
+
+    def assertCurveEqual(self, curve, expected):
+        self.assertEqual(len(curve), len(expected))
+        for (x, y), (ex, ey) in zip(curve, expected):
+            self.assertAlmostEqual(x, ex, delta=1e-9)
+            self.assertAlmostEqual(y, ey, delta=1e-9)
+
+    def test_matches_de_casteljau(self):
+        rnd = random.Random(2)
+        for resolution in (3, 7, 32, 33, 100):
+            for segments in (1, 3):
+                points = [(rnd.uniform(-640, 640), rnd.uniform(-480, 480)) for _ in range(3 * segments + 1)]
+                self.assertCurveEqual(cubic(points, resolution), reference(points, resolution, 3))
+                points = points[:2 * segments + 1]
+                self.assertCurveEqual(quadratic(points, resolution), reference(points, resolution, 2))
+
+    def test_invalid_arguments(self):
+        points = [(0, 0), (1, 1), (2, 1), (3, 0)]
+        self.assertRaises(ValueError, quadratic, points, 3)
+        self.assertRaises(ValueError, quadratic, points[:3], 2)
+        self.assertRaises(ValueError, quadratic, points[:1], 3)
+        self.assertRaises(ValueError, cubic, points[:3], 3)
+        self.assertRaises(ValueError, cubic, points + [(4, 0)], 3)
+        self.assertRaises(ValueError, cubic, points, 2)
+        self.assertRaises(ValueError, Bezier(BM_CUBIC, Point()).bake_curve, 3)
+        self.assertRaises(ValueError, Bezier(BM_CUBIC, Point(), Point()).bake_curve, 2)
+
+    def test_points_are_floats(self):
+        for resolution in (3, 7, 32, 33, 100):
+            curves = (quadratic([(0, 0), (1, 1), (2, 0)], resolution),
+                      cubic([(0, 0), (1, 1), (2, 1), (3, 0)], resolution))
+            for curve in curves:
+                for x, y in curve[:-1]:
+                    self.assertIs(type(x), float)
+                    self.assertIs(type(y), float)
+
+
+if __name__ == '__main__':
+    unittest.main()